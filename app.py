@@ -1,64 +1,212 @@
 from __future__ import annotations
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import os
+import re
 
-from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+import orjson
+from anyio import to_thread
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 DATA_DIR: Path = Path("data")
 IMAGES_DIR: Path = Path("images")
 
-app: FastAPI = FastAPI()
+app: FastAPI = FastAPI(default_response_class=ORJSONResponse)
 app.mount("/images", StaticFiles(directory=str(IMAGES_DIR)), name="images")
 app.mount("/static", StaticFiles(directory="templates"), name="static")  # optional
 templates: Jinja2Templates = Jinja2Templates(directory="templates")
 
 
+# Bundles keyed by path: (st_mtime_ns, st_size, parsed bundle, raw file bytes).
+# Entries are revalidated with a stat on every access, so edits to data/ are
+# picked up without a restart. Cached dicts are shared across requests: never
+# mutate them.
+_CacheEntry = Tuple[int, int, Dict[str, Any], bytes]
+_BUNDLE_CACHE: Dict[str, _CacheEntry] = {}
+
+# (DATA_DIR st_mtime_ns, doc_id -> bundle path), rebuilt whenever DATA_DIR's mtime
+# changes (file added, removed or renamed). Lookups then parse at most the one
+# matching bundle. A rebuild fills a fresh dict and publishes it together with its
+# mtime in one assignment, so concurrent readers never see a half-built index.
+_DOC_INDEX: Tuple[int, Dict[str, Path]] = (-1, {})
+
+# (DATA_DIR st_mtime_ns, sorted bundle paths)
+_PATHS: Tuple[int, List[Path]] = (-1, [])
+
+# Views derived from a bundle, keyed by doc_id: (bundle, value). Valid while
+# _read_bundle keeps returning the same bundle object, i.e. until the file changes;
+# _evict_stale drops entries for deleted or replaced bundles.
+_HTML_CACHE: Dict[str, Tuple[Dict[str, Any], bytes]] = {}
+_PAGE_CACHE: Dict[str, Tuple[Dict[str, Any], Tuple[Dict[int, str], Tuple[int, str]]]] = {}
+
+# Rendered index.html, keyed by the (id, title) listing it was rendered from.
+_HOME_HTML: Tuple[Optional[Tuple[Tuple[str, str], ...]], bytes] = (None, b"")
+
+
+def _fresh_entry(path: Path) -> Optional[_CacheEntry]:
+    """Cached entry for path if the file is unchanged since it was read, else None."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    hit = _BUNDLE_CACHE.get(str(path))
+    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return hit
+    return None
+
+
+def _read_entry(path: Path) -> _CacheEntry:
+    """Read and parse a bundle file, reusing the cached entry while its mtime/size are unchanged."""
+    hit = _fresh_entry(path)
+    if hit is not None:
+        return hit
+    key = str(path)
+    st = path.stat()
+    raw: bytes = path.read_bytes()
+    entry: _CacheEntry = (st.st_mtime_ns, st.st_size, orjson.loads(raw), raw)
+    _BUNDLE_CACHE[key] = entry
+    return entry
+
+
+def _read_bundle(path: Path) -> Dict[str, Any]:
+    return _read_entry(path)[2]
+
+
+def _data_mtime() -> int:
+    """DATA_DIR's st_mtime_ns, or -1 if it doesn't exist (treated as an empty directory)."""
+    try:
+        return DATA_DIR.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _bundle_paths() -> List[Path]:
+    """Sorted *.json files in DATA_DIR, re-listed only when the directory's mtime changes."""
+    global _PATHS
+    mtime: int = _data_mtime()
+    if _PATHS[0] != mtime:
+        try:
+            with os.scandir(DATA_DIR) as it:
+                names = sorted(e.name for e in it if e.name.endswith(".json") and e.is_file())
+        except OSError:
+            names = []
+        _PATHS = (mtime, [DATA_DIR / n for n in names])
+    return _PATHS[1]
+
+
+def _evict_stale(paths: List[Path], bundles: List[Dict[str, Any]]) -> None:
+    """Drop cached bundles for files no longer in DATA_DIR, and derived views whose
+    doc_id is gone or whose bundle has since been replaced."""
+    live = {str(p) for p in paths}
+    current: Dict[str, Dict[str, Any]] = {}
+    for b in bundles:
+        current.setdefault(b.get("doc_id"), b)
+    # Worker threads may evict or insert concurrently: snapshot the keys and
+    # tolerate a key another thread already dropped.
+    for k in list(_BUNDLE_CACHE):
+        if k not in live:
+            _BUNDLE_CACHE.pop(k, None)
+    for cache in (_HTML_CACHE, _PAGE_CACHE):
+        for did, hit in list(cache.items()):
+            if current.get(did) is not hit[0]:
+                cache.pop(did, None)
+
+
 def _load_bundles() -> List[Dict[str, Any]]:
     """Load all bundle JSON files from DATA_DIR."""
-    return [json.loads(p.read_text()) for p in sorted(DATA_DIR.glob("*.json"))]
+    paths: List[Path] = _bundle_paths()
+    bundles = [_read_bundle(p) for p in paths]
+    _evict_stale(paths, bundles)
+    return bundles
 
 
-def _get_bundle(doc_id: str) -> Optional[Dict[str, Any]]:
-    for p in DATA_DIR.glob("*.json"):
-        b: Dict[str, Any] = json.loads(p.read_text())
-        if b.get("doc_id") == doc_id:
-            return b
-    return None
+def _refresh_index() -> Dict[str, Path]:
+    """The doc_id -> path index, rebuilt when the entries of DATA_DIR change."""
+    global _DOC_INDEX
+    mtime: int = _data_mtime()
+    indexed_mtime, index = _DOC_INDEX
+    if mtime == indexed_mtime:
+        return index
+    new_index: Dict[str, Path] = {}
+    paths: List[Path] = _bundle_paths()
+    bundles = [_read_bundle(p) for p in paths]
+    for p, b in zip(paths, bundles):
+        did = b.get("doc_id")
+        if did is not None:
+            new_index.setdefault(did, p)
+    _evict_stale(paths, bundles)
+    _DOC_INDEX = (mtime, new_index)
+    return new_index
 
 
-@app.get("/", response_class=HTMLResponse)
-def home(request: Request) -> HTMLResponse:
-    bundles: List[Dict[str, Any]] = _load_bundles()
-    docs: List[Dict[str, str]] = [{"id": b["doc_id"], "title": b.get("title", b["doc_id"])} for b in bundles]
-    return templates.TemplateResponse("index.html", {"request": request, "docs": docs})
+def _get_entry(doc_id: str) -> Optional[_CacheEntry]:
+    global _DOC_INDEX
+    path: Optional[Path] = _refresh_index().get(doc_id)
+    if path is None:
+        return None
+    entry: _CacheEntry = _read_entry(path)
+    if entry[2].get("doc_id") != doc_id:
+        # File was rewritten in place with another doc_id; rebuild on next lookup.
+        _DOC_INDEX = (-1, {})
+        return None
+    return entry
 
 
-@app.get("/doc/{doc_id}", response_class=HTMLResponse)
-def view_doc(doc_id: str, request: Request) -> HTMLResponse:
-    bundle: Optional[Dict[str, Any]] = _get_bundle(doc_id)
-    if bundle is None:
-        return templates.TemplateResponse("index.html", {"request": request, "docs": []})
+# Handlers are async so warm requests (pure cache lookups plus a stat) run on the
+# event loop without a threadpool hop. Anything that has to read or parse files
+# is pushed to a worker thread instead of blocking the loop.
+
+async def _aget_entry(doc_id: str) -> Optional[_CacheEntry]:
+    indexed_mtime, index = _DOC_INDEX
+    path = index.get(doc_id) if _data_mtime() == indexed_mtime else None
+    if path is not None:
+        hit = _fresh_entry(path)
+        if hit is not None and hit[2].get("doc_id") == doc_id:
+            return hit
+    return await to_thread.run_sync(_get_entry, doc_id)
+
+
+async def _aload_bundles() -> List[Dict[str, Any]]:
+    if _data_mtime() == _PATHS[0]:
+        hits = [_fresh_entry(p) for p in _PATHS[1]]
+        if all(h is not None for h in hits):
+            return [h[2] for h in hits]
+    return await to_thread.run_sync(_load_bundles)
+
+
+@app.get("/", response_class=HTMLResponse)
+async def home(request: Request) -> HTMLResponse:
+    global _HOME_HTML
+    bundles: List[Dict[str, Any]] = await _aload_bundles()
+    listing = tuple((b["doc_id"], b.get("title", b["doc_id"])) for b in bundles)
+    if _HOME_HTML[0] != listing:
+        docs: List[Dict[str, str]] = [{"id": did, "title": title} for did, title in listing]
+        _HOME_HTML = (listing, templates.get_template("index.html").render(docs=docs).encode())
+    return HTMLResponse(_HOME_HTML[1])
 
-    # Flatten spans and enrich with section context + alignment hints
+
+def _flatten_spans(bundle: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], int]:
+    """Flatten section spans (enriched with section context + alignment hints) and pick the first page."""
     spans: List[Dict[str, Any]] = []
-    sid_to_titles: Dict[str, Tuple[str, str]] = {}
+    append = spans.append
     for section in bundle.get("sections", []):
         sid: str = section.get("sid", "")
-        sid_to_titles[sid] = (section.get("title_vi", ""), section.get("title_en", ""))
+        tvi: str = section.get("title_vi", "")
+        ten: str = section.get("title_en", "")
         for sp in section.get("spans", []):
-            sp2 = dict(sp)
-            sp2["_section_sid"] = sid
-            tvi, ten = sid_to_titles[sid]
-            sp2["_section_title_vi"] = tvi
-            sp2["_section_title_en"] = ten
-            align = sp2.get("align") or {}
-            sp2["_align_status"] = align.get("status")
-            sp2["_align_method"] = align.get("method")
-            spans.append(sp2)
+            align = sp.get("align") or {}
+            # One C-level merge instead of dict(sp) + five item assignments
+            append({
+                **sp,
+                "_section_sid": sid,
+                "_section_title_vi": tvi,
+                "_section_title_en": ten,
+                "_align_status": align.get("status"),
+                "_align_method": align.get("method"),
+            })
 
     # Sort by page number for robust rendering
     spans.sort(key=lambda s: int(s.get("page", 10**9)))
@@ -70,44 +218,162 @@ def view_doc(doc_id: str, request: Request) -> HTMLResponse:
             first_page = int(sorted(bundle["pages"], key=lambda p: int(p.get("page", 10**9)))[0]["page"])
         except Exception:
             first_page = 1
+    return spans, first_page
+
+
+def _page_index(bundle: Dict[str, Any]) -> Tuple[Dict[int, str], Tuple[int, str]]:
+    """Map page number -> image src from the bundle's 'pages' array, plus the (page, src) fallback."""
+    by_page: Dict[int, str] = {}
+    for p in bundle.get("pages", []):
+        try:
+            num = int(p["page"])
+        except Exception:  # no usable page number: skip rather than invent one
+            continue
+        by_page.setdefault(num, p.get("image") or p.get("src") or "")
+    if not by_page:
+        return by_page, (1, "")
+    first = min(by_page)
+    return by_page, (first, by_page[first])
+
+
+def _render_doc(bundle: Dict[str, Any]) -> bytes:
+    """Render doc.html for a bundle. The templates don't touch `request`, so the output is cacheable."""
+    spans, first_page = _flatten_spans(bundle)
+    return templates.get_template("doc.html").render(bundle=bundle, spans=spans, first_page=first_page).encode()
+
+
+def _memo(
+    cache: Dict[str, Tuple[Dict[str, Any], Any]],
+    doc_id: str,
+    bundle: Dict[str, Any],
+    build: Callable[[Dict[str, Any]], Any],
+) -> Any:
+    """Return build(bundle), computed once per parsed bundle object (i.e. until the file changes)."""
+    hit = cache.get(doc_id)
+    if hit is not None and hit[0] is bundle:
+        return hit[1]
+    value = build(bundle)
+    cache[doc_id] = (bundle, value)
+    return value
+
+
+@app.get("/doc/{doc_id}", response_class=HTMLResponse)
+async def view_doc(doc_id: str, request: Request) -> HTMLResponse:
+    entry = await _aget_entry(doc_id)
+    bundle: Optional[Dict[str, Any]] = entry[2] if entry else None
+    if bundle is None:
+        return templates.TemplateResponse("index.html", {"request": request, "docs": []})
+
+    hit = _HTML_CACHE.get(doc_id)
+    if hit is not None and hit[0] is bundle:
+        return HTMLResponse(hit[1])
+    # Cold render (span flattening + Jinja) is CPU work: keep it off the event loop.
+    html: bytes = await to_thread.run_sync(_memo, _HTML_CACHE, doc_id, bundle, _render_doc)
+    return HTMLResponse(html)
+
 
-    return templates.TemplateResponse(
-        "doc.html",
-        {
-            "request": request,
-            "bundle": bundle,
-            "spans": spans,
-            "first_page": first_page,
-        },
-    )
+def _etag(entry: _CacheEntry) -> str:
+    """Weak validator for a bundle file (and anything derived from it): mtime_ns + size."""
+    return f'W/"{entry[0]:x}-{entry[1]:x}"'
 
 
-@app.get("/api/doc/{doc_id}.json", response_class=JSONResponse)
-def api_doc(doc_id: str) -> JSONResponse:
-    bundle = _get_bundle(doc_id)
-    if bundle:
-        return JSONResponse(bundle)
-    return JSONResponse({"error": "not found"}, status_code=404)
+def _cache_headers(etag: str) -> Dict[str, str]:
+    return {"ETag": etag, "Cache-Control": "public, max-age=60, must-revalidate"}
 
 
-@app.get("/api/doc/{doc_id}/page/{page}", response_class=JSONResponse)
-def api_doc_page(doc_id: str, page: int) -> JSONResponse:
+def _etag_matches(request: Request, etag: str) -> bool:
+    """True if the request's If-None-Match names this ETag (weak comparison) or '*'."""
+    inm: Optional[str] = request.headers.get("if-none-match")
+    if not inm:
+        return False
+    tags = {t.strip().removeprefix("W/") for t in inm.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+@app.get("/api/doc/{doc_id}.json", response_class=ORJSONResponse)
+async def api_doc(doc_id: str, request: Request) -> Response:
+    entry = await _aget_entry(doc_id)
+    if not (entry and entry[2]):
+        return ORJSONResponse({"error": "not found"}, status_code=404)
+    etag = _etag(entry)
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=_cache_headers(etag))
+    # The bundle file is already JSON: serve its bytes as-is, no re-serialization
+    return Response(content=entry[3], media_type="application/json", headers=_cache_headers(etag))
+
+
+@app.get("/api/doc/{doc_id}/page/{page}", response_class=ORJSONResponse)
+async def api_doc_page(doc_id: str, page: int, request: Request) -> Response:
     """
     Resolve image source for a given doc_id+page using the bundle's 'pages' array
     as the source of truth (supports .png/.jpg/.jpeg and arbitrary filenames).
     """
-    bundle = _get_bundle(doc_id)
-    if not bundle:
-        return JSONResponse({"error": "not found"}, status_code=404)
-    pages: List[Dict[str, Any]] = bundle.get("pages", [])
-    for p in pages:
-        try:
-            if int(p.get("page", -1)) == page:
-                src = p.get("image") or p.get("src") or ""
-                return JSONResponse({"page": page, "src": src})
-        except Exception:
-            continue
-    if pages:
-        p0 = sorted(pages, key=lambda x: int(x.get("page", 10**9)))[0]
-        return JSONResponse({"page": int(p0.get("page", 1)), "src": p0.get("image") or p0.get("src") or ""})
-    return JSONResponse({"page": 1, "src": ""})
+    entry = await _aget_entry(doc_id)
+    if not (entry and entry[2]):
+        return ORJSONResponse({"error": "not found"}, status_code=404)
+    etag = _etag(entry)
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=_cache_headers(etag))
+    by_page, (first, first_src) = _memo(_PAGE_CACHE, doc_id, entry[2], _page_index)
+    src = by_page.get(page)
+    if src is not None:
+        return ORJSONResponse({"page": page, "src": src}, headers=_cache_headers(etag))
+    return ORJSONResponse({"page": first, "src": first_src}, headers=_cache_headers(etag))
+
+
+# Legacy page -> image lookup straight from IMAGES_DIR, for callers that only know
+# a page number. (IMAGES_DIR st_mtime_ns, {page: src}), rebuilt when files are
+# added/removed/renamed; the first file (by name) carrying a page number wins.
+_IMAGE_EXTS: Tuple[str, ...] = (".jpg", ".jpeg", ".png")
+_DIGITS_RE: re.Pattern[str] = re.compile(r"\d+")
+_PAGE_SRC: Tuple[int, Dict[int, str]] = (-1, {})
+
+
+def _images_mtime() -> int:
+    try:
+        return IMAGES_DIR.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _page_src_index() -> Dict[int, str]:
+    global _PAGE_SRC
+    mtime: int = _images_mtime()
+    if _PAGE_SRC[0] == mtime and mtime != -1:
+        return _PAGE_SRC[1]
+    index: Dict[int, str] = {}
+    try:
+        with os.scandir(IMAGES_DIR) as it:
+            names = sorted(e.name for e in it if e.name.lower().endswith(_IMAGE_EXTS) and e.is_file())
+    except OSError:
+        names = []
+    for name in names:
+        m = _DIGITS_RE.search(name)
+        if m is not None:
+            index.setdefault(int(m.group()), f"/images/{name}")
+    _PAGE_SRC = (mtime, index)
+    return index
+
+
+@app.get("/page-src/{page}", response_class=ORJSONResponse)
+async def page_src(page: int, request: Request) -> Response:
+    """Image src for a page number, falling back to the lowest-numbered page."""
+    mtime: int = _images_mtime()
+    # The answer only changes when IMAGES_DIR's entries do; no validator while it's missing.
+    headers: Dict[str, str] = {}
+    if mtime != -1:
+        etag = f'W/"{mtime:x}"'
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers=_cache_headers(etag))
+        headers = _cache_headers(etag)
+    if mtime != -1 and _PAGE_SRC[0] == mtime:
+        index: Dict[int, str] = _PAGE_SRC[1]
+    else:
+        index = await to_thread.run_sync(_page_src_index)
+    src = index.get(page)
+    if src is not None:
+        return ORJSONResponse({"page": page, "src": src}, headers=headers)
+    if not index:
+        return ORJSONResponse({"page": page, "src": ""}, headers=headers)
+    first = min(index)
+    return ORJSONResponse({"page": first, "src": index[first]}, headers=headers)
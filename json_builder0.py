@@ -1,32 +1,48 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any, Union
+from concurrent.futures import ProcessPoolExecutor
 import argparse
-import json
+import functools
+import os
 import re
 import sys
-import xml.etree.ElementTree as ET
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback
+    import json
+    orjson = None
+
+try:
+    from lxml import etree as ET
+    # Match the stdlib parser, which never materializes comments/PIs as nodes and
+    # has no cap on text node size (libxml2 refuses nodes > 10MB without huge_tree).
+    _ITERPARSE_KW: Dict[str, Any] = {"remove_comments": True, "remove_pis": True, "huge_tree": True}
+except ImportError:  # stdlib fallback
+    import xml.etree.ElementTree as ET
+    _ITERPARSE_KW = {}
 
 
 # ---------- Data structures ----------
 
-@dataclass
+@dataclass(slots=True)
 class Span:
     aid: str
     page: int
     vi: str
     en: str
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     sid: str
     title_vi: str
     title_en: str
     spans: List[Span]
 
-@dataclass
+@dataclass(slots=True)
 class Bundle:
     doc_id: str
     title: str
@@ -36,47 +52,109 @@ class Bundle:
 
 # ---------- Utilities ----------
 
-_WHITESPACE_RE = re.compile(r"[ \t\r\f\v]+")
+# Runs of inline whitespace other than a lone space (lone spaces need no rewrite)
+_WHITESPACE_RE = re.compile(r" [ \t\f\v]+|[\t\f\v][ \t\f\v]*")
 _MULTI_NEWLINE_RE = re.compile(r"\n{2,}")
+_DIGITS_RE = re.compile(r"\d+")
 
-def _norm(s: str) -> str:
+class _LowerTags(dict):
+    """tag -> lowercased tag, filled on first sight. Documents use a handful of
+    tag names, so lookups hit a prebuilt string instead of allocating via .lower()."""
+    def __missing__(self, tag: Any) -> str:
+        low = self[tag] = tag.lower() if isinstance(tag, str) else ""
+        return low
+
+_TAG = _LowerTags()
+
+def _norm_text(s: str) -> str:
     """Normalize whitespace (preserve single newlines within paragraphs)."""
-    s = s.replace("\r\n", "\n").replace("\r", "\n")
-    s = _MULTI_NEWLINE_RE.sub("\n\n", s.strip())
-    # collapse runs of spaces/tabs inside lines
-    lines = [ _WHITESPACE_RE.sub(" ", ln).strip() for ln in s.split("\n") ]
-    return "\n".join(lines).strip()
+    if "\r" in s:
+        s = s.replace("\r\n", "\n").replace("\r", "\n")
+    # collapse runs of spaces/tabs in one pass over the whole string, then trim lines
+    s = _WHITESPACE_RE.sub(" ", s)
+    if "\n" not in s:
+        return s.strip()  # single line (titles, list items): nothing to split
+    s = _MULTI_NEWLINE_RE.sub("\n\n", s)
+    return "\n".join([ln.strip() for ln in s.split("\n")]).strip()
+
+_norm_cached = functools.lru_cache(maxsize=1024)(_norm_text)
+
+def _norm(s: str) -> str:
+    # Only short fragments (titles, headers, labels) repeat; paragraph text is
+    # effectively unique and would just pin dead strings in every pool worker.
+    return _norm_cached(s) if len(s) <= 256 else _norm_text(s)
 
 def _text_of(elem: ET.Element) -> str:
     return _norm("".join(elem.itertext()))
 
 
 def _extract_digits(s: str) -> Optional[int]:
-    m = re.search(r"(\d+)", s)
-    return int(m[1]) if m else None
+    """First run of digits in s as an int (None if there is none)."""
+    if s.isdecimal():  # bare page="12" attributes; isdecimal() matches \d exactly
+        return int(s)
+    m = _DIGITS_RE.search(s)
+    return int(m.group()) if m else None
 
 def _text_with_breaks(elem: ET.Element) -> str:
     """
     Extract text from an XML element, preserving <br/> as newline.
     """
+    if not len(elem):
+        return _norm(elem.text or "")
+    # Iterative walk: the stack holds elements still to open and literal strings
+    # (tails, "\n" for <br/>), pushed in reverse so pops come out in document order.
     parts: List[str] = []
-
-    def rec(e: ET.Element):
+    stack: List[Union[str, ET.Element]] = [elem]
+    while stack:
+        e = stack.pop()
+        if isinstance(e, str):
+            parts.append(e)
+            continue
         if e.text:
             parts.append(e.text)
-        for ch in list(e):
-            if (ch.tag or "").lower() == "br":
-                parts.append("\n")
-                if ch.tail:
-                    parts.append(ch.tail)
-                continue
-            rec(ch)
+        for ch in reversed(e):
             if ch.tail:
-                parts.append(ch.tail)
-
-    rec(elem)
+                stack.append(ch.tail)
+            stack.append("\n" if _TAG[ch.tag] == "br" else ch)
     return _norm("".join(parts))
 
+def _iter_top_level(xml_path: Path) -> Iterator[Union[str, ET.Element]]:
+    """
+    Stream the root's content in document order without building the whole tree:
+    the root's text and each top-level child's tail are yielded as str, and each
+    top-level child as a complete Element. A child is dropped from the tree once
+    its tail has been yielded, so peak memory is bounded by one top-level element.
+    """
+    depth = 0
+    root: Optional[ET.Element] = None
+    prev: Optional[ET.Element] = None
+    for event, elem in ET.iterparse(str(xml_path), events=("start", "end"), **_ITERPARSE_KW):
+        if event == "start":
+            if depth == 0:
+                root = elem
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 1:
+            # A top-level child just completed; everything before it is final.
+            if prev is None:
+                if root.text:
+                    yield root.text
+            else:
+                if prev.tail:
+                    yield prev.tail
+                root.remove(prev)
+            yield elem
+            del elem[:]
+            prev = elem
+        elif depth == 0:
+            if prev is None:
+                if elem.text:
+                    yield elem.text
+            elif prev.tail:
+                yield prev.tail
+            elem.clear()
+
 # ---------- Image helpers ----------
 
 def _iter_unannotated_images(images_dir: Path) -> List[Path]:
@@ -84,13 +162,15 @@ def _iter_unannotated_images(images_dir: Path) -> List[Path]:
     Return image files that contain 'unannotated_page' in the filename
     (case-insensitive) and have a common image extension.
     """
-    exts = {".png", ".jpg", ".jpeg"}
-    return sorted(
-        p for p in images_dir.iterdir()
-        if p.is_file()
-        and p.suffix.lower() in exts
-        and "unannotated_page" in p.name.lower()
-    )
+    exts = (".png", ".jpg", ".jpeg")
+    with os.scandir(images_dir) as it:
+        names = sorted(
+            e.name for e in it
+            if (low := e.name.lower()).endswith(exts)
+            and "unannotated_page" in low
+            and e.is_file()
+        )
+    return [images_dir / n for n in names]
 
 # ---------- Vietnamese OCR parsing (pagebreak format, verbatim text preservation) ----------
 
@@ -100,32 +180,46 @@ def parse_vi_ocr_xml(xml_path: Path) -> Dict[int, str]:
     Returns a dict: {page_number: raw_text_preserving_newlines}.
     We DO NOT split into paragraphs; we preserve newlines and blank lines as-is.
     """
-    root = ET.parse(xml_path).getroot()
     current_page = 1
     buckets: Dict[int, List[str]] = {}
-
-    def push(text: str):
+    parts: List[str] = []  # raw text of the current page segment, in document order
+
+    def flush() -> None:
+        seg = "".join(parts)
+        parts.clear()
+        if seg.strip():
+            buckets.setdefault(current_page, []).append(seg)
+
+    def walk(root: ET.Element) -> None:
+        # Iterative (huge_tree allows nesting deeper than the recursion limit): the
+        # stack holds elements still to open and tails, pushed in reverse so pops
+        # come out in document order -- text first, then children, each child's tail.
         nonlocal current_page
-        if not text:
-            return
-        buckets.setdefault(current_page, []).append(text)
-
-    # Collect text chunks in document order
-    for node in root.iter():
-        tag = (node.tag or '').lower()
-        if tag == 'pagebreak':
-            # switch page
-            page_attr = node.attrib.get('page', '')
-            num = _extract_digits(page_attr)
-            if num is not None:
-                current_page = num
-            continue
-        # Accumulate all textual content except pagebreak markers
-        txt = ''.join(node.itertext()) if node is not root else (node.text or '')
-        txt = txt or ''
-        # Preserve original newlines; but normalize trailing spaces
-        if txt.strip():
-            push(txt)
+        stack: List[Union[str, ET.Element]] = [root]
+        while stack:
+            e = stack.pop()
+            if isinstance(e, str):
+                parts.append(e)
+                continue
+            if _TAG[e.tag] == "pagebreak":
+                num = _extract_digits(e.attrib.get("page", ""))
+                if num is not None and num != current_page:
+                    flush()
+                    current_page = num
+            elif e.text:
+                parts.append(e.text)
+            for ch in reversed(e):
+                if ch.tail:
+                    stack.append(ch.tail)
+                stack.append(ch)
+
+    # Every text node and tail is visited once, in document order
+    for item in _iter_top_level(xml_path):
+        if isinstance(item, str):
+            parts.append(item)
+        else:
+            walk(item)
+    flush()
 
     # Join buckets preserving blank lines
     vi_by_page: Dict[int, str] = {
@@ -145,15 +239,20 @@ def parse_en_translation_xml(xml_path: Path) -> Tuple[Dict[int, str], Optional[s
     Returns:
         (en_by_page: {page: text}, doc_title: Optional[str])
     """
-    root = ET.parse(xml_path).getroot()
-
     en_buckets: Dict[int, List[str]] = {}
     current_page: int = 1
     doc_title: Optional[str] = None
 
     def push(pg: int, text: str) -> None:
-        if text.strip():
-            en_buckets.setdefault(pg, []).append(text.strip())
+        text = text.strip()
+        if not text:
+            return
+        # get-then-insert: setdefault(pg, []) would build a throwaway list on every push
+        bucket = en_buckets.get(pg)
+        if bucket is None:
+            en_buckets[pg] = [text]
+        else:
+            bucket.append(text)
 
     def maybe_set_title(title_text: str) -> None:
         nonlocal doc_title
@@ -180,8 +279,8 @@ def parse_en_translation_xml(xml_path: Path) -> Tuple[Dict[int, str], Optional[s
             maybe_set_title(_text_with_breaks(title_el))
 
         # Stream through children in order; flip page when we see <pagebreak/>
-        for child in list(sec):
-            tag = (child.tag or "").lower()
+        for child in sec:
+            tag = _TAG[child.tag]
             if tag == "pagebreak":
                 num = page_from_attr(child)
                 if num is not None:
@@ -206,8 +305,10 @@ def parse_en_translation_xml(xml_path: Path) -> Tuple[Dict[int, str], Optional[s
                     push(current_page, txt)
 
     # We want to honor pagebreaks that can appear between sections too. Iterate top-level in order.
-    for node in list(root):
-        tag = (node.tag or "").lower()
+    for node in _iter_top_level(xml_path):
+        if isinstance(node, str):
+            continue
+        tag = _TAG[node.tag]
 
         if tag == "pagebreak":
             num = page_from_attr(node)
@@ -238,7 +339,7 @@ def parse_en_translation_xml(xml_path: Path) -> Tuple[Dict[int, str], Optional[s
         if inner_breaks:
             # Walk depth-first and simulate what collect_section does
             for sub in node.iter():
-                stag = (sub.tag or "").lower()
+                stag = _TAG[sub.tag]
                 if stag == "pagebreak":
                     num = page_from_attr(sub)
                     if num is not None:
@@ -279,21 +380,19 @@ def align_and_build(
         pages.append({"page": num, "image": f"/images/{img.name}"})
 
     # Union of all pages appearing in either stream (or in images as context)
-    page_set = set(vi_by_page.keys()) | set(en_by_page.keys())
+    page_set = vi_by_page.keys() | en_by_page.keys()  # keys views union straight into a set
     if not page_set and pages:
         page_set = {p['page'] for p in pages}
     ordered_pages = sorted(page_set)
 
-    spans: List[Span] = []
-    spans.extend(
-        Span(
-            aid=f"{doc_id}:pg:{pg}",
-            page=pg,
-            vi=vi_by_page.get(pg, ""),
-            en=en_by_page.get(pg, ""),
-        )
+    # Hoist lookups out of the per-page loop
+    vi_get = vi_by_page.get
+    en_get = en_by_page.get
+    aid_prefix = f"{doc_id}:pg:"
+    spans: List[Span] = [
+        Span(aid_prefix + str(pg), pg, vi_get(pg, ""), en_get(pg, ""))
         for pg in ordered_pages
-    )
+    ]
     section = Section(sid="s1", title_vi="", title_en="", spans=spans)
     title = fallback_title or doc_id.replace('-', ' ').title()
     return Bundle(doc_id=doc_id, title=title, pages=pages, sections=[section])
@@ -301,53 +400,63 @@ def align_and_build(
 
 # ---------- Validation ----------
 
-@dataclass
+@dataclass(slots=True)
 class ValidationIssue:
     level: str  # "ERROR" | "WARN" | "INFO"
     code: str
     message: str
 
-def validate_bundle(bundle: Bundle, images_dir: Path) -> List[ValidationIssue]:
+def validate_bundle(bundle: Bundle, images_dir: Optional[Path] = None) -> List[ValidationIssue]:
     issues: List[ValidationIssue] = []
 
-    # Check unique aids
-    seen: set[str] = set()
+    # Single pass over spans; issues are bucketed so the report keeps its
+    # grouping: duplicates, missing images, empty texts, one-sided pages.
+    referenced_pages: set[int] = set()
+    empty: List[ValidationIssue] = []
+    one_sided: List[ValidationIssue] = []
     for sec in bundle.sections:
         for sp in sec.spans:
-            if sp.aid in seen:
+            # aids are "{doc_id}:pg:{page}" (align_and_build), so a repeated aid is a
+            # repeated page: reuse the page set rather than hashing aid strings.
+            n_pages = len(referenced_pages)
+            referenced_pages.add(sp.page)
+            if len(referenced_pages) == n_pages:
                 issues.append(ValidationIssue("ERROR", "DUP_AID", f"Duplicate aid: {sp.aid}"))
-            seen.add(sp.aid)
-
-    # Check page numbers present and corresponding images exist (best-effort)
-    img_index: Dict[int, List[Path]] = {}
-    for p in _iter_unannotated_images(images_dir):
-        num = _extract_digits(p.stem) or _extract_digits(p.name)
+            has_vi = bool(sp.vi.strip())
+            has_en = bool(sp.en.strip())
+            if not has_vi:
+                empty.append(ValidationIssue("WARN", "EMPTY_VI", f"{sp.aid} has empty Vietnamese text"))
+            if not has_en:
+                empty.append(ValidationIssue("WARN", "EMPTY_EN", f"{sp.aid} has empty English text"))
+            # Warn if a page has only one side populated
+            if has_en and not has_vi:
+                one_sided.append(ValidationIssue("INFO", "VI_MISSING_ON_PAGE", f"VI empty on page {sp.page}"))
+            if has_vi and not has_en:
+                one_sided.append(ValidationIssue("INFO", "EN_MISSING_ON_PAGE", f"EN empty on page {sp.page}"))
+
+    # Check referenced pages have an image. Only filenames that spell out a
+    # page number count: align_and_build gives digitless images a positional
+    # fallback number, which must not hide a genuinely missing page. Reuse the
+    # names in bundle.pages when present; scan images_dir only without them.
+    if bundle.pages:
+        img_names = [p["image"].rpartition("/")[2] for p in bundle.pages]
+    elif images_dir is not None:
+        img_names = [img.name for img in _iter_unannotated_images(images_dir)]
+    else:
+        img_names = []
+    img_pages: set[int] = set()
+    for name in img_names:
+        num = _extract_digits(Path(name).stem) or _extract_digits(name)
         if num is not None:
-            img_index.setdefault(num, []).append(p)
-
-    referenced_pages = {sp.page for sec in bundle.sections for sp in sec.spans}
+            img_pages.add(num)
     issues.extend(
         ValidationIssue(
             "WARN", "MISSING_IMAGE", f"No image found for page {num}"
         )
-        for num in sorted(referenced_pages)
-        if num not in img_index
+        for num in sorted(referenced_pages - img_pages)
     )
-    # Check empty texts
-    for sec in bundle.sections:
-        for sp in sec.spans:
-            if not sp.vi.strip():
-                issues.append(ValidationIssue("WARN", "EMPTY_VI", f"{sp.aid} has empty Vietnamese text"))
-            if not sp.en.strip():
-                issues.append(ValidationIssue("WARN", "EMPTY_EN", f"{sp.aid} has empty English text"))
-
-    # Warn if a page has only one side populated
-    for sec in bundle.sections:
-        for sp in sec.spans:
-            if not sp.vi.strip() and sp.en.strip():
-                issues.append(ValidationIssue("INFO", "VI_MISSING_ON_PAGE", f"VI empty on page {sp.page}"))
-            if sp.vi.strip() and not sp.en.strip():
-                issues.append(ValidationIssue("INFO", "EN_MISSING_ON_PAGE", f"EN empty on page {sp.page}"))
+    issues.extend(empty)
+    issues.extend(one_sided)
 
     return issues
 
@@ -369,19 +478,52 @@ def bundle_to_dict(bundle: Bundle) -> Dict[str, Any]:
                 "sid": sec.sid,
                 "title_vi": sec.title_vi,
                 "title_en": sec.title_en,
-                "spans": [asdict(sp) for sp in sec.spans],
+                "spans": [
+                    {"aid": sp.aid, "page": sp.page, "vi": sp.vi, "en": sp.en}
+                    for sp in sec.spans
+                ],
             } for sec in bundle.sections
         ],
     }
 
 
 def write_bundle_json(bundle: Bundle, out_path: Path) -> None:
+    """Serialize bundle and atomically replace out_path (readers never see a partial file)."""
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(bundle_to_dict(bundle), ensure_ascii=False, indent=2))
+    obj = bundle_to_dict(bundle)
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    # Per-process temp name: parallel builds of journal dirs sharing a name
+    # (same doc_id) must not write through each other's temp file.
+    tmp = out_path.with_suffix(f".json.{os.getpid()}.tmp")
+    try:
+        # Raw fd writes of the encoded bytes: no buffered/text file object on top
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp, out_path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 # ---------- Discovery ----------
 
+def _find_one(directory: Path, prefix: str, suffix: str) -> Optional[Path]:
+    """First entry named <prefix>*<suffix> in directory order (same pick as next(glob(...)))."""
+    with os.scandir(directory) as it:
+        for e in it:
+            n = e.name
+            if n.startswith(prefix) and n.endswith(suffix) and len(n) >= len(prefix) + len(suffix):
+                return directory / n
+    return None
+
 def find_journal_inputs(journal_dir: Path) -> Tuple[Path, Path, Path]:
     """
     Discover the expected input files and images directory in a journal folder.
@@ -395,8 +537,8 @@ def find_journal_inputs(journal_dir: Path) -> Tuple[Path, Path, Path]:
     if not journal_dir.exists():
         raise FileNotFoundError(f"{journal_dir} not found")
 
-    vi_xml = next(iter(journal_dir.glob("full_cleaned_*.xml")), None)
-    en_xml = next(iter(journal_dir.glob("translation_*.xml")), None)
+    vi_xml = _find_one(journal_dir, "full_cleaned_", ".xml")
+    en_xml = _find_one(journal_dir, "translation_", ".xml")
     images_dir = journal_dir / "images"
 
     if not vi_xml:
@@ -441,13 +583,20 @@ def build_from_journal_dir(journal_dir: Path, out_dir: Path) -> Tuple[Optional[B
     )
 
     # Validate
-    issues = validate_bundle(bundle, images_dir=images_dir)
+    issues = validate_bundle(bundle, images_dir)
     # Write
     out_path = out_dir / f"{doc_id}.json"
     write_bundle_json(bundle, out_path)
     return bundle, issues
 
 
+def _build_one(journal_dir: Path, out_dir: Path) -> Tuple[str, List[ValidationIssue]]:
+    """Worker entry point: build one journal dir, return only what main() reports (cheap to pickle)."""
+    bundle, issues = build_from_journal_dir(journal_dir, out_dir)
+    assert bundle
+    return bundle.doc_id, issues
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     # sourcery skip: use-fstring-for-concatenation
     parser = argparse.ArgumentParser(description="Build JVB JSON bundles from OCR + translation XML")
@@ -457,24 +606,38 @@ def main(argv: Optional[List[str]] = None) -> int:
                         help="Output directory for bundle JSON (default: ./data)")
     parser.add_argument("--report", action="store_true",
                         help="Print validation issues report to stderr")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Worker processes for multiple journal dirs (default: CPU count; 1 = build in-process)")
     args = parser.parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
-    exit_code = 0
-    for jd in args.journal_dirs:
-        try:
-            bundle, issues = build_from_journal_dir(jd, args.out)
-            assert bundle
-            print(f"[OK] {bundle.doc_id} → {args.out / (bundle.doc_id + '.json')}")
-            if args.report and issues:
-                for it in issues:
-                    print(f" - {it.level}: {it.code}: {it.message}", file=sys.stderr)
-            # Promote ERROR to non-zero exit
-            if any(it.level == "ERROR" for it in issues):
-                exit_code = 2
-        except Exception as e:
-            print(f"[FAIL] {jd}: {e}", file=sys.stderr)
-            exit_code = 1
+    # Journal dirs are independent (own inputs, own output file): fan out across
+    # processes. Results are still reported in argument order.
+    jobs: List[Path] = args.journal_dirs
+    workers = min(len(jobs), args.jobs or os.cpu_count() or 1)
+    ex = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    futs = [ex.submit(_build_one, jd, args.out) for jd in jobs] if ex else []
 
+    exit_code = 0
+    try:
+        for i, jd in enumerate(jobs):
+            try:
+                doc_id, issues = futs[i].result() if ex else _build_one(jd, args.out)
+                print(f"[OK] {doc_id} → {args.out / (doc_id + '.json')}")
+                if args.report and issues:
+                    for it in issues:
+                        print(f" - {it.level}: {it.code}: {it.message}", file=sys.stderr)
+                # Promote ERROR to non-zero exit
+                if any(it.level == "ERROR" for it in issues):
+                    exit_code = 2
+            except Exception as e:
+                print(f"[FAIL] {jd}: {e}", file=sys.stderr)
+                exit_code = 1
+    finally:
+        if ex:
+            # On Ctrl-C, don't leave queued journals running in the background
+            ex.shutdown(cancel_futures=True)
     return exit_code
 
 
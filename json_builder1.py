@@ -270,14 +270,31 @@ Glossary
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict, field
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Iterable
+from typing import AbstractSet, Callable, Dict, List, Optional, Tuple, Any, Iterable, Iterator, Union
 import argparse
+import functools
 import json
+import os
 import re
 import sys
-import xml.etree.ElementTree as ET
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback
+    orjson = None
+
+try:
+    from lxml import etree as ET
+    # Match the stdlib parser, which never materializes comments/PIs as nodes and
+    # has no cap on text node size (libxml2 refuses nodes > 10MB without huge_tree).
+    _ITERPARSE_KW: Dict[str, Any] = {"remove_comments": True, "remove_pis": True, "huge_tree": True}
+except ImportError:  # stdlib fallback
+    import xml.etree.ElementTree as ET
+    _ITERPARSE_KW = {}
 
 
 
@@ -285,13 +302,13 @@ import xml.etree.ElementTree as ET
 
 # ---- Low-level primitives ----
 
-@dataclass
+@dataclass(slots=True)
 class SpanAlign:
     status: str  # "exact" | "inferred" | "pending"
     method: Optional[str] = None  # e.g., "human", "vi_proportional", "uniform", None
     source: Optional[str] = None  # e.g., "section", "page"
 
-@dataclass
+@dataclass(slots=True)
 class Span:
     aid: str             # page-level AID: p:{doc_id}:{page}
     page: int
@@ -299,14 +316,14 @@ class Span:
     en: str
     align: Optional[SpanAlign] = None
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     sid: str             # logical section AID: s:{doc_id}:{slug-or-index}
     title_vi: str
     title_en: str
     spans: List[Span]    # page-level spans that belong to the section (may have empty EN if unknown)
 
-@dataclass
+@dataclass(slots=True)
 class SectionBlock:
     """
     Section-level text container with pagination status/breaks.
@@ -317,7 +334,7 @@ class SectionBlock:
     vi: str
     pagination: Dict[str, Any]  # {target_pages: [...], status, breaks: [int], method}
 
-@dataclass
+@dataclass(slots=True)
 class ValidationIssue:
     level: str  # "ERROR" | "WARN" | "INFO"
     code: str
@@ -325,7 +342,7 @@ class ValidationIssue:
 
 # ---- Aggregates ----
 
-@dataclass
+@dataclass(slots=True)
 class Bundle:
     doc_id: str
     title: str
@@ -366,56 +383,114 @@ class EnParseResult:
 
 # ========== Utilities ==========
 
-_WHITESPACE_RE = re.compile(r"[ \t\r\f\v]+")
+# Runs of inline whitespace other than a lone space (lone spaces need no rewrite)
+_WHITESPACE_RE = re.compile(r" [ \t\f\v]+|[\t\f\v][ \t\f\v]*")
 _MULTI_NEWLINE_RE = re.compile(r"\n{2,}")
 _NON_WORD_RE = re.compile(r"[^a-z0-9\-]+")
+_MULTI_DASH_RE = re.compile(r"-{2,}")
+_DIGITS_RE = re.compile(r"\d+")
+
+class _LowerTags(dict):
+    """tag -> lowercased tag, filled on first sight. Documents use a handful of
+    tag names, so lookups hit a prebuilt string instead of allocating via .lower()."""
+    def __missing__(self, tag: Any) -> str:
+        low = self[tag] = tag.lower() if isinstance(tag, str) else ""
+        return low
+
+_TAG = _LowerTags()
 
 def _norm(s: str) -> str:
     """Normalize whitespace (preserve single newlines within paragraphs)."""
-    s = s.replace("\r\n", "\n").replace("\r", "\n")
-    s = _MULTI_NEWLINE_RE.sub("\n\n", s.strip())
-    lines = [_WHITESPACE_RE.sub(" ", ln).strip() for ln in s.split("\n")]
-    return "\n".join(lines).strip()
+    if "\r" in s:
+        s = s.replace("\r\n", "\n").replace("\r", "\n")
+    # collapse runs of spaces/tabs in one pass over the whole string, then trim lines
+    s = _WHITESPACE_RE.sub(" ", s)
+    if "\n" not in s:
+        return s.strip()  # single line (titles, list items): nothing to split
+    s = _MULTI_NEWLINE_RE.sub("\n\n", s)
+    return "\n".join([ln.strip() for ln in s.split("\n")]).strip()
 
 def _text_of(elem: ET.Element) -> str:
     return _norm("".join(elem.itertext()))
 
 def _extract_digits(s: str) -> Optional[int]:
-    # sourcery skip: use-getitem-for-re-match-groups
-    m = re.search(r"(\d+)", s)
-    return int(m.group(1)) if m else None
+    """First run of digits in s as an int (None if there is none)."""
+    if s.isdecimal():  # bare page="12" attributes; isdecimal() matches \d exactly
+        return int(s)
+    m = _DIGITS_RE.search(s)
+    return int(m.group()) if m else None
 
 def _text_with_breaks(elem: ET.Element) -> str:
     """
     Extract text from an XML element, preserving <br/> as newline.
     """
+    if not len(elem):
+        return _norm(elem.text or "")
+    # Iterative walk: the stack holds elements still to open and literal strings
+    # (tails, "\n" for <br/>), pushed in reverse so pops come out in document order.
     parts: List[str] = []
-
-    def rec(e: ET.Element):
+    stack: List[Union[str, ET.Element]] = [elem]
+    while stack:
+        e = stack.pop()
+        if isinstance(e, str):
+            parts.append(e)
+            continue
         if e.text:
             parts.append(e.text)
-        for ch in list(e):
-            if (ch.tag or "").lower() == "br":
-                parts.append("\n")
-                if ch.tail:
-                    parts.append(ch.tail)
-                continue
-            rec(ch)
+        for ch in reversed(e):
             if ch.tail:
-                parts.append(ch.tail)
-
-    rec(elem)
+                stack.append(ch.tail)
+            stack.append("\n" if _TAG[ch.tag] == "br" else ch)
     return _norm("".join(parts))
 
+@functools.lru_cache(maxsize=4096)
 def _slug(s: str, fallback: str) -> str:
+    # Titles are slugged twice per build (EN parse and section metadata)
     s = (s or "").strip().lower()
     if not s:
         return fallback
     s = s.replace("&", " and ")
     s = _NON_WORD_RE.sub("-", s)
-    s = re.sub(r"-{2,}", "-", s).strip("-")
+    s = _MULTI_DASH_RE.sub("-", s).strip("-")
     return s or fallback
 
+def _iter_top_level(xml_path: Path) -> Iterator[Union[str, ET.Element]]:
+    """
+    Stream the root's content in document order without building the whole tree:
+    the root's text and each top-level child's tail are yielded as str, and each
+    top-level child as a complete Element. A child is dropped from the tree once
+    its tail has been yielded, so peak memory is bounded by one top-level element.
+    """
+    depth = 0
+    root: Optional[ET.Element] = None
+    prev: Optional[ET.Element] = None
+    for event, elem in ET.iterparse(str(xml_path), events=("start", "end"), **_ITERPARSE_KW):
+        if event == "start":
+            if depth == 0:
+                root = elem
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 1:
+            # A top-level child just completed; everything before it is final.
+            if prev is None:
+                if root.text:
+                    yield root.text
+            else:
+                if prev.tail:
+                    yield prev.tail
+                root.remove(prev)
+            yield elem
+            del elem[:]
+            prev = elem
+        elif depth == 0:
+            if prev is None:
+                if elem.text:
+                    yield elem.text
+            elif prev.tail:
+                yield prev.tail
+            elem.clear()
+
 
 # ========== Image helpers ==========
 
@@ -424,13 +499,30 @@ def _iter_unannotated_images(images_dir: Path) -> List[Path]:
     Return image files that contain 'unannotated_page' in the filename
     (case-insensitive) and have a common image extension.
     """
-    exts = {".png", ".jpg", ".jpeg"}
-    return sorted(
-        p for p in images_dir.iterdir()
-        if p.is_file()
-        and p.suffix.lower() in exts
-        and "unannotated_page" in p.name.lower()
-    )
+    exts = (".png", ".jpg", ".jpeg")
+    with os.scandir(images_dir) as it:
+        names = sorted(
+            e.name for e in it
+            if (low := e.name.lower()).endswith(exts)
+            and "unannotated_page" in low
+            and e.is_file()
+        )
+    return [images_dir / n for n in names]
+
+
+def _scan_images(images_dir: Path) -> List[Tuple[Path, Optional[int]]]:
+    """
+    (path, page digits or None) for each unannotated page image, sorted by name.
+    build_from_journal_dir scans once and hands the result to build and validation.
+    """
+    return [
+        (p, _extract_digits(p.stem) or _extract_digits(p.name))
+        for p in _iter_unannotated_images(images_dir)
+    ]
+
+def _image_page_index(image_scan: List[Tuple[Path, Optional[int]]]) -> frozenset[int]:
+    """Page numbers that have an image (digitless files excluded)."""
+    return frozenset(num for _, num in image_scan if num is not None)
 
 
 # ========== Vietnamese OCR parsing (pagebreak format, verbatim text preservation) ==========
@@ -441,28 +533,46 @@ def parse_vi_ocr_xml(xml_path: Path) -> Dict[int, str]:
     Returns a dict: {page_number: raw_text_preserving_newlines}.
     We DO NOT split into paragraphs; we preserve newlines and blank lines as-is.
     """
-    root = ET.parse(xml_path).getroot()
     current_page = 1
-    buckets: Dict[int, List[str]] = {}
-
-    def push(text: str):
+    buckets: Dict[int, List[str]] = defaultdict(list)
+    parts: List[str] = []  # raw text of the current page segment, in document order
+
+    def flush() -> None:
+        seg = "".join(parts)
+        parts.clear()
+        if seg.strip():
+            buckets[current_page].append(seg)
+
+    def walk(root: ET.Element) -> None:
+        # Iterative (huge_tree allows nesting deeper than the recursion limit): the
+        # stack holds elements still to open and tails, pushed in reverse so pops
+        # come out in document order -- text first, then children, each child's tail.
         nonlocal current_page
-        if not text:
-            return
-        buckets.setdefault(current_page, []).append(text)
-
-    for node in root.iter():
-        tag = (node.tag or "").lower()
-        if tag == "pagebreak":
-            page_attr = node.attrib.get("page", "")
-            num = _extract_digits(page_attr)
-            if num is not None:
-                current_page = num
-            continue
-        txt = "".join(node.itertext()) if node is not root else (node.text or "")
-        txt = txt or ""
-        if txt.strip():
-            push(txt)
+        stack: List[Union[str, ET.Element]] = [root]
+        while stack:
+            e = stack.pop()
+            if isinstance(e, str):
+                parts.append(e)
+                continue
+            if _TAG[e.tag] == "pagebreak":
+                num = _extract_digits(e.attrib.get("page", ""))
+                if num is not None and num != current_page:
+                    flush()
+                    current_page = num
+            elif e.text:
+                parts.append(e.text)
+            for ch in reversed(e):
+                if ch.tail:
+                    stack.append(ch.tail)
+                stack.append(ch)
+
+    # Every text node and tail is visited once, in document order
+    for item in _iter_top_level(xml_path):
+        if isinstance(item, str):
+            parts.append(item)
+        else:
+            walk(item)
+    flush()
 
     vi_by_page: Dict[int, str] = {pg: "\n".join(chunks) for pg, chunks in buckets.items()}
     return vi_by_page
@@ -479,14 +589,12 @@ def parse_en_translation_xml(doc_id: str, xml_path: Path) -> EnParseResult:
     - Collects <notes> and <translation-notes> as page-scoped sidecars (for now; we reattach to sAID later).
     - Preserves <br/> as newlines.
     """
-    root = ET.parse(xml_path).getroot()
-
-    en_buckets: Dict[int, List[str]] = {}
+    en_buckets: Dict[int, List[str]] = defaultdict(list)
     current_page: int = 1
     doc_title: Optional[str] = None
 
-    notes_by_page: Dict[int, List[str]] = {}
-    trnotes_by_page: Dict[int, List[str]] = {}
+    notes_by_page: Dict[int, List[str]] = defaultdict(list)
+    trnotes_by_page: Dict[int, List[str]] = defaultdict(list)
 
     section_en_by_sid: Dict[str, str] = {}
     section_pages_observed: Dict[str, List[int]] = {}
@@ -498,12 +606,14 @@ def parse_en_translation_xml(doc_id: str, xml_path: Path) -> EnParseResult:
 
     # --------- Local helpers (IO-free, pure) ----------
     def push_page(pg: int, text: str) -> None:
-        if text.strip():
-            en_buckets.setdefault(pg, []).append(text.strip())
+        text = text.strip()
+        if text:
+            en_buckets[pg].append(text)
 
     def note_add(target: Dict[int, List[str]], pg: int, text: str) -> None:
-        if text.strip():
-            target.setdefault(pg, []).append(text.strip())
+        text = text.strip()
+        if text:
+            target[pg].append(text)
 
     def maybe_set_title(title_text: str) -> None:
         nonlocal doc_title
@@ -523,24 +633,33 @@ def parse_en_translation_xml(doc_id: str, xml_path: Path) -> EnParseResult:
         return "\n".join([it for it in items if it.strip()])
 
     def _collect_notes_text(el: ET.Element) -> str:
-        paras = [_text_with_breaks(p) for p in el.findall("./p")]
-        if not paras:
+        paras: List[str] = []
+        has_p = False
+        for p in el.iterfind("./p"):
+            has_p = True
+            if (txt := _text_with_breaks(p)).strip():
+                paras.append(txt)
+        if not has_p:
+            # no <p> children: the note body is the element's own text
             txt = _text_with_breaks(el)
-            if txt.strip():
-                paras = [txt]
-        return "\n\n".join([p for p in paras if p.strip()])
+            return txt if txt.strip() else ""
+        return "\n\n".join(paras)
 
     def _start_section(sec_el: ET.Element) -> str:
         nonlocal section_counter, current_sid, current_section_chunks
         section_counter += 1
         title_vi_el = sec_el.find("./title_vi")
-        title_en_el = sec_el.find("./title") or sec_el.find("./title_en")
+        title_en_el = sec_el.find("./title")
+        if title_en_el is None or not len(title_en_el):
+            # Same pick as `find(title) or find(title_en)`: an Element without
+            # children is falsy. Spelled out to avoid lxml's FutureWarning.
+            title_en_el = sec_el.find("./title_en")
         title_vi = _text_with_breaks(title_vi_el) if title_vi_el is not None else ""
         title_en = _text_with_breaks(title_en_el) if title_en_el is not None else ""
         if title_en:
             maybe_set_title(title_en)
         slug = _slug(title_en or title_vi, fallback=f"{section_counter:02d}")
-        sid = f"s:{doc_id}:{slug}"
+        sid = sys.intern(f"s:{doc_id}:{slug}")
         section_titles[sid] = (title_vi, title_en)
         current_sid = sid
         current_section_chunks = []
@@ -558,18 +677,18 @@ def parse_en_translation_xml(doc_id: str, xml_path: Path) -> EnParseResult:
     # --------- Dispatchers ----------
     def _handle_section_child(child: ET.Element, sid: str) -> None:
         nonlocal current_page
-        ctag = (child.tag or "").lower()
-        match ctag:
-            case "pagebreak":
-                num = page_from_attr(child)
-                if num is not None:
-                    current_page = num
-                    section_pages_observed[sid].append(num)
+        ctag = _TAG[child.tag]
+        match ctag:  # most frequent arm first: literal cases are tested in order
             case "p":
                 txt = _text_with_breaks(child)
                 if txt:
                     push_page(current_page, txt)
                     current_section_chunks.append(txt)
+            case "pagebreak":
+                num = page_from_attr(child)
+                if num is not None:
+                    current_page = num
+                    section_pages_observed[sid].append(num)
             case "ul" | "ol":
                 txt = _collect_list_text(child)
                 if txt:
@@ -594,7 +713,7 @@ def parse_en_translation_xml(doc_id: str, xml_path: Path) -> EnParseResult:
 
     def _handle_top_level(node: ET.Element) -> None:
         nonlocal current_page
-        tag = (node.tag or "").lower()
+        tag = _TAG[node.tag]
         match tag:
             case "pagebreak":
                 num = page_from_attr(node)
@@ -604,7 +723,7 @@ def parse_en_translation_xml(doc_id: str, xml_path: Path) -> EnParseResult:
                 # Close any previous open section (defensive)
                 _end_section(current_sid)
                 sid = _start_section(node)
-                for child in list(node):
+                for child in node:
                     _handle_section_child(child, sid)
                 _end_section(sid)
             case "notes":
@@ -620,7 +739,7 @@ def parse_en_translation_xml(doc_id: str, xml_path: Path) -> EnParseResult:
                 inner_breaks = node.findall(".//pagebreak")
                 if inner_breaks:
                     for sub in node.iter():
-                        stag = (sub.tag or "").lower()
+                        stag = _TAG[sub.tag]
                         if stag == "pagebreak":
                             num = page_from_attr(sub)
                             if num is not None:
@@ -633,16 +752,17 @@ def parse_en_translation_xml(doc_id: str, xml_path: Path) -> EnParseResult:
                         push_page(current_page, txt)
 
     # --------- Stream the document ----------
-    for node in list(root):
-        _handle_top_level(node)
+    for node in _iter_top_level(xml_path):
+        if not isinstance(node, str):  # top-level text between elements is ignored
+            _handle_top_level(node)
 
     en_by_page: Dict[int, str] = {pg: "\n\n".join(chunks) for pg, chunks in en_buckets.items()}
 
     return EnParseResult(
         en_by_page=en_by_page,
         doc_title=doc_title,
-        notes_by_page=notes_by_page,
-        trnotes_by_page=trnotes_by_page,
+        notes_by_page=dict(notes_by_page),  # plain dicts out: no insert-on-read for callers
+        trnotes_by_page=dict(trnotes_by_page),
         section_en_by_sid=section_en_by_sid,
         section_pages_observed=section_pages_observed,
         section_titles=section_titles,
@@ -665,14 +785,14 @@ def _load_sections_json(doc_id: str, path: Path) -> Optional[List[SectionMeta]]:
     """
     if not path.exists():
         return None
-    obj = json.loads(path.read_text())
+    obj = orjson.loads(path.read_bytes()) if orjson is not None else json.loads(path.read_text())
     items = obj.get("sections") or []
     metas: List[SectionMeta] = []
     for i, it in enumerate(items, start=1):
         title_en = (it.get("title_en") or "").strip()
         title_vi = (it.get("title_vi") or "").strip()
         slug = _slug(title_en or title_vi, fallback=f"{i:02d}")
-        sid = f"s:{doc_id}:{slug}"
+        sid = sys.intern(f"s:{doc_id}:{slug}")
         sp = int(it.get("start_page"))
         ep = int(it.get("end_page"))
         metas.append(SectionMeta(sid=sid, title_vi=title_vi, title_en=title_en, start_page=sp, end_page=ep))
@@ -683,14 +803,13 @@ def _load_sections_json(doc_id: str, path: Path) -> Optional[List[SectionMeta]]:
 
 import warnings
 
-def _pages_from_images(images_dir: Path) -> List[Dict[str, Any]]:
+def _pages_from_images(image_scan: List[Tuple[Path, Optional[int]]]) -> List[Dict[str, Any]]:
     pages: List[Dict[str, Any]] = []
     used_numbers = set()
     fallback_counter = 1
-    # Sort images by name to ensure deterministic ordering for fallback numbering
-    images = sorted(_iter_unannotated_images(images_dir), key=lambda img: img.name)
-    for img in images:
-        num = _extract_digits(img.stem) or _extract_digits(img.name) or 0
+    # Images come sorted by name, so fallback numbering is deterministic
+    for img, num in image_scan:
+        num = num or 0
         if num == 0:
             # Find the next available fallback number not already used
             while fallback_counter in used_numbers:
@@ -709,46 +828,27 @@ def _pages_from_images(images_dir: Path) -> List[Dict[str, Any]]:
         pages.append({"page": num, "image": f"/images/{img.name}"})
     return pages
 
-def _build_aid_index_from_meta(metas: List[SectionMeta]) -> Tuple[Dict[str, List[int]], Dict[str, str]]:
+def _build_aid_index_from_meta(metas: List[SectionMeta]) -> Tuple[Dict[str, List[int]], Dict[int, str]]:
     section_to_pages: Dict[str, List[int]] = {}
-    page_to_section: Dict[str, str] = {}
+    page_to_section: Dict[int, str] = {}
     for m in metas:
-        rng = list(range(m.start_page, m.end_page + 1))
-        section_to_pages[m.sid] = rng
-        for p in rng:
-            page_to_section[str(p)] = m.sid
+        rng = range(m.start_page, m.end_page + 1)
+        # Kept as a list: the same object is emitted as aid_index and target_pages
+        section_to_pages[m.sid] = list(rng)
+        page_to_section.update(dict.fromkeys(rng, m.sid))
     return section_to_pages, page_to_section
 
-def _build_aid_index_from_en_observed(s_titles: Dict[str, Tuple[str, str]], s_pages: Dict[str, List[int]]) -> Tuple[Dict[str, List[int]], Dict[str, str]]:
+def _build_aid_index_from_en_observed(s_titles: Dict[str, Tuple[str, str]], s_pages: Dict[str, List[int]]) -> Tuple[Dict[str, List[int]], Dict[int, str]]:
     section_to_pages: Dict[str, List[int]] = {}
-    page_to_section: Dict[str, str] = {}
+    page_to_section: Dict[int, str] = {}
     for sid, pages in s_pages.items():
-        uniq = []
-        seen = set()
-        for p in pages:
-            if p not in seen:
-                uniq.append(p)
-                seen.add(p)
+        uniq = list(dict.fromkeys(pages))  # ordered dedup
         if uniq:
             section_to_pages[sid] = uniq
             for p in uniq:
-                page_to_section[str(p)] = sid
+                page_to_section[p] = sid
     return section_to_pages, page_to_section
 
-def _attach_annotations(
-    annotations: Dict[str, Dict[str, List[str]]],
-    aid: str,
-    notes: List[str] | None,
-    trnotes: List[str] | None,
-) -> None:
-    if not notes and not trnotes:
-        return
-    dest = annotations.setdefault(aid, {})
-    if notes:
-        dest.setdefault("notes", []).extend(notes)
-    if trnotes:
-        dest.setdefault("translation_notes", []).extend(trnotes)
-
 def _compute_title(doc_id: str, parse_res: EnParseResult, fallback_title: Optional[str]) -> str:
     """
     Choose a human-friendly title:
@@ -758,76 +858,83 @@ def _compute_title(doc_id: str, parse_res: EnParseResult, fallback_title: Option
     """
     return fallback_title or parse_res.doc_title or doc_id.replace("-", " ").title()
 
-def _make_sections(
+def _make_section_outputs(
     doc_id: str,
-    spans_by_page: Dict[int, Span],
+    page_set: AbstractSet[int],
+    make_span: Callable[[int], Span],
     title_lookup: Dict[str, Tuple[str, str]],
     section_to_pages: Dict[str, List[int]],
-) -> List[Section]:
-    """
-    Assemble Section objects in a predictable order using title_lookup keys.
-    Each Section contains the Span objects for its pages (if present).
-    """
-    sections: List[Section] = []
-    # Sort section ids by the first page number in section_to_pages, or float('inf') if no pages
-    sorted_sids = sorted(
-        title_lookup.keys(),
-        key=lambda sid: section_to_pages.get(sid, [float('inf')])[0] if section_to_pages.get(sid) else float('inf')
-    )
-    for sid in sorted_sids:
-        title_vi, title_en = title_lookup.get(sid, ("", ""))
-        pg_list = section_to_pages.get(sid, [])
-        sec_spans = [spans_by_page[p] for p in pg_list if p in spans_by_page]
-        sections.append(Section(sid=sid, title_vi=title_vi, title_en=title_en, spans=sec_spans))
-    return sections
-
-def _make_section_blocks(
-    section_order: List[str],
-    section_to_pages: Dict[str, List[int]],
     parse_res: EnParseResult,
-) -> List[SectionBlock]:
+) -> Tuple[List[Section], Optional[List[SectionBlock]], Optional[Dict[str, Dict[str, List[str]]]]]:
     """
-    Build SectionBlock entries capturing the full EN text and pagination state.
-    A section is 'exact' if all target pages have non-empty EN; 'incomplete' if
-    there are target pages but some are missing EN; 'pending' if no targets.
+    One pass over the sections (title_lookup order) producing, per section:
+    - the Section with a Span for each of its pages present in page_set,
+    - the SectionBlock with the full EN text and pagination state: 'exact' if all
+      target pages have non-empty EN, 'incomplete' if some are missing EN,
+      'pending' if there are no target pages,
+    - an empty annotations entry for its sAID (placeholder for future edits).
+    Sections are returned
+    ordered by first page; blocks and annotations keep title_lookup order and come
+    back as None when empty.
     """
+    sections: List[Section] = []
     section_blocks: List[SectionBlock] = []
+    annotations = _make_page_annotations(doc_id, parse_res)  # page notes come first
+    en_get, section_en_get = parse_res.en_by_page.get, parse_res.section_en_by_sid.get
     vi = ""
-    for sid in section_order:
-        en = parse_res.section_en_by_sid.get(sid, "")
-        target_pages = section_to_pages.get(sid, [])
-        all_have_en = all(parse_res.en_by_page.get(p, "").strip() for p in target_pages) if target_pages else False
-        status = "exact" if (target_pages and all_have_en) else ("incomplete" if target_pages else "pending")
+    for sid, (title_vi, title_en) in title_lookup.items():
+        target_pages = section_to_pages.get(sid)
+        if target_pages:
+            sec_spans = [make_span(p) for p in target_pages if p in page_set]
+            status = "exact" if all(en_get(p, "").strip() for p in target_pages) else "incomplete"
+        else:
+            # Nothing to look up, but the section and its 'pending' block are still
+            # emitted: pending pagination is part of the bundle, and validation reports it
+            target_pages, sec_spans, status = [], [], "pending"
+        sections.append(Section(sid=sid, title_vi=title_vi, title_en=title_en, spans=sec_spans))
+
         pagination = {"target_pages": target_pages, "status": status, "breaks": [], "method": None}
-        section_blocks.append(SectionBlock(aid=sid, en=en, vi=vi, pagination=pagination))
-    return section_blocks
+        section_blocks.append(SectionBlock(aid=sid, en=section_en_get(sid, ""), vi=vi, pagination=pagination))
+
+        annotations.setdefault(sid, {})
+
+    # Stable sort on the first page number (sections without pages last), so ties
+    # keep title_lookup order
+    inf = float("inf")
+    sections.sort(key=lambda sec: section_to_pages[sec.sid][0] if section_to_pages.get(sec.sid) else inf)
+    return sections, section_blocks or None, annotations or None
 
-def _make_annotations(doc_id: str, section_order: List[str], parse_res: EnParseResult) -> Optional[Dict[str, Dict[str, List[str]]]]:
+def _make_page_annotations(doc_id: str, parse_res: EnParseResult) -> Dict[str, Dict[str, List[str]]]:
     """
-    Construct the annotations sidecar keyed by AID. Page-scoped notes are attached to pAIDs.
-    Empty dicts for section AIDs are created to simplify future edits.
+    Start the annotations sidecar keyed by AID: page-scoped notes attached to pAIDs.
     """
     annotations: Dict[str, Dict[str, List[str]]] = {}
-    for pg, notes in parse_res.notes_by_page.items():
-        _attach_annotations(annotations, f"p:{doc_id}:{pg}", notes, None)
-    for pg, tnotes in parse_res.trnotes_by_page.items():
-        _attach_annotations(annotations, f"p:{doc_id}:{pg}", None, tnotes)
-    for sid in section_order:
-        annotations.setdefault(sid, {})
-    return annotations or None
+    pid_prefix = f"p:{doc_id}:"
+    notes_by_page, trnotes_by_page = parse_res.notes_by_page, parse_res.trnotes_by_page
+    # One pass over the annotated pages (dict union keeps notes pages first, as before)
+    for pg in notes_by_page | trnotes_by_page:
+        entry: Dict[str, List[str]] = {}
+        if notes := notes_by_page.get(pg):
+            entry["notes"] = list(notes)
+        if tnotes := trnotes_by_page.get(pg):
+            entry["translation_notes"] = list(tnotes)
+        if entry:
+            annotations[pid_prefix + str(pg)] = entry
+    return annotations
 
 def _make_aid_index(
     section_to_pages: Dict[str, List[int]],
-    page_to_section: Dict[str, str],
+    page_to_section: Dict[int, str],
 ) -> Optional[Dict[str, Any]]:
     """
     Package the routing indices into a stable dict shape or return None if empty.
+    page_to_section is int-keyed while building; the packaged index uses str keys.
     """
     if not section_to_pages:
         return None
     return {
         "section_to_pages": section_to_pages,
-        "page_to_section": page_to_section,
+        "page_to_section": {str(p): sid for p, sid in page_to_section.items()},
     }
 
 def build_bundle(
@@ -837,11 +944,15 @@ def build_bundle(
     parse_res: EnParseResult,
     sections_meta: Optional[List[SectionMeta]] = None,
     fallback_title: Optional[str] = None,
+    image_scan: Optional[List[Tuple[Path, Optional[int]]]] = None,
 ) -> Bundle:
     """
     Build a rich bundle with two AID layers and sidecars.
+    image_scan is a precomputed _scan_images(images_dir); scanned here if None.
     """
-    pages = _pages_from_images(images_dir)
+    if image_scan is None:
+        image_scan = _scan_images(images_dir)
+    pages = _pages_from_images(image_scan)
 
     # SECTION↔PAGE INDEX (prefer external meta; else EN observed)
     if sections_meta:
@@ -854,32 +965,27 @@ def build_bundle(
         title_lookup = parse_res.section_titles
 
     # PAGE UNION
-    page_set = set(vi_by_page.keys()) | set(parse_res.en_by_page.keys())
+    page_set = vi_by_page.keys() | parse_res.en_by_page.keys()  # view union: no temp sets
     if not page_set and pages:
         page_set = {p["page"] for p in pages}
-    ordered_pages = sorted(page_set)
 
     # Human-friendly title
     title = _compute_title(doc_id, parse_res, fallback_title)
 
-    # Build page-level Span objects
-    spans_by_page: Dict[int, Span] = {}
-    for pg in ordered_pages:
-        en = parse_res.en_by_page.get(pg, "")
-        vi = vi_by_page.get(pg, "")
-        sid = page_to_section.get(str(pg))
-        align = SpanAlign(status="pending", source="section") if (not en and sid) else None
-        spans_by_page[pg] = Span(aid=f"p:{doc_id}:{pg}", page=pg, vi=vi, en=en, align=align)
+    # Page-level Span objects are built straight into their sections; pages that
+    # belong to no section never get one
+    pid_prefix = f"p:{doc_id}:"
+    en_get, vi_get, sid_get = parse_res.en_by_page.get, vi_by_page.get, page_to_section.get
 
-    # Sections
-    sections = _make_sections(doc_id, spans_by_page, title_lookup, section_to_pages)
+    def make_span(pg: int) -> Span:
+        en = en_get(pg, "")
+        align = SpanAlign(status="pending", source="section") if (not en and sid_get(pg)) else None
+        return Span(aid=pid_prefix + str(pg), page=pg, vi=vi_get(pg, ""), en=en, align=align)
 
-    # Section blocks
-    section_order = list(title_lookup.keys())
-    section_blocks = _make_section_blocks(section_order, section_to_pages, parse_res) or None
-
-    # Annotations sidecar
-    annotations = _make_annotations(doc_id, section_order, parse_res)
+    # Sections, section blocks and the annotations sidecar
+    sections, section_blocks, annotations = _make_section_outputs(
+        doc_id, page_set, make_span, title_lookup, section_to_pages, parse_res
+    )
 
     # Aid index
     aid_index = _make_aid_index(section_to_pages, page_to_section)
@@ -898,40 +1004,22 @@ def build_bundle(
 
 # ========== Validation ==========
 
-def validate_bundle(bundle: Bundle, images_dir: Path) -> List[ValidationIssue]:
+def validate_bundle(
+    bundle: Bundle,
+    images_dir: Path,
+    img_index: Optional[frozenset[int]] = None,
+) -> List[ValidationIssue]:
+    """
+    img_index is the set of page numbers with an image (_image_page_index); when
+    None, images_dir is scanned.
+    """
     issues: List[ValidationIssue] = []
 
-    def _check_unique_aids() -> None:
-        seen: set[str] = set()
-        for sec in bundle.sections:
-            for sp in sec.spans:
-                if sp.aid in seen:
-                    issues.append(ValidationIssue("ERROR", "DUP_AID", f"Duplicate aid: {sp.aid}"))
-                seen.add(sp.aid)
-
-    def _build_image_index() -> Dict[int, List[Path]]:
-        idx: Dict[int, List[Path]] = {}
-        for p in _iter_unannotated_images(images_dir):
-            num = _extract_digits(p.stem) or _extract_digits(p.name)
-            if num is not None:
-                idx.setdefault(num, []).append(p)
-        return idx
-
-    def _check_images(img_index: Dict[int, List[Path]]) -> None:
-        referenced_pages = {sp.page for sec in bundle.sections for sp in sec.spans}
-        for num in sorted(referenced_pages):
-            if num not in img_index:
-                issues.append(ValidationIssue("WARN", "MISSING_IMAGE", f"No image found for page {num}"))
-
-    def _check_texts_and_alignment() -> None:
-        for sec in bundle.sections:
-            for sp in sec.spans:
-                if not sp.vi.strip():
-                    issues.append(ValidationIssue("WARN", "EMPTY_VI", f"{sp.aid} has empty Vietnamese text"))
-                if not sp.en.strip():
-                    issues.append(ValidationIssue("WARN", "EMPTY_EN", f"{sp.aid} has empty English text"))
-                if sp.align and sp.align.status == "pending":
-                    issues.append(ValidationIssue("INFO", "EN_PENDING_FROM_SECTION", f"{sp.aid} EN pending; source=section"))
+    def _image_pages() -> frozenset[int]:
+        # Only membership is checked, so keep page numbers, not per-page path lists
+        if img_index is not None:
+            return img_index
+        return _image_page_index(_scan_images(images_dir))
 
     def _check_section_blocks() -> None:
         if not bundle.section_blocks:
@@ -953,10 +1041,33 @@ def validate_bundle(bundle: Bundle, images_dir: Path) -> List[ValidationIssue]:
                     f"Section {sb.aid} has no target pages",
                 ))
 
-    _check_unique_aids()
-    img_index = _build_image_index()
-    _check_images(img_index)
-    _check_texts_and_alignment()
+    # Single pass over spans; issues are bucketed so the report keeps its
+    # grouping: duplicates, missing images, then per-span text/alignment notes.
+    referenced_pages: set[int] = set()
+    span_issues: List[ValidationIssue] = []
+    add_issue = span_issues.append
+    for sec in bundle.sections:
+        for sp in sec.spans:
+            aid = sp.aid
+            # aids are "p:{doc_id}:{page}" (build_bundle), so a repeated aid is a
+            # repeated page: reuse the page set rather than hashing aid strings.
+            n_pages = len(referenced_pages)
+            referenced_pages.add(sp.page)
+            if len(referenced_pages) == n_pages:
+                issues.append(ValidationIssue("ERROR", "DUP_AID", f"Duplicate aid: {aid}"))
+            if not sp.vi.strip():
+                add_issue(ValidationIssue("WARN", "EMPTY_VI", f"{aid} has empty Vietnamese text"))
+            if not sp.en.strip():
+                add_issue(ValidationIssue("WARN", "EMPTY_EN", f"{aid} has empty English text"))
+            align = sp.align
+            if align and align.status == "pending":
+                add_issue(ValidationIssue("INFO", "EN_PENDING_FROM_SECTION", f"{aid} EN pending; source=section"))
+
+    issues.extend(
+        ValidationIssue("WARN", "MISSING_IMAGE", f"No image found for page {num}")
+        for num in sorted(referenced_pages - _image_pages())
+    )
+    issues.extend(span_issues)
     _check_section_blocks()
     return issues
 
@@ -972,11 +1083,15 @@ def _span_to_dict(sp: Span) -> Dict[str, Any]:
     """
     Serialize a Span to a plain dict, ensuring align is serialized (if present).
     """
-    if sp.align is None:
-        return asdict(sp)
-    d = asdict(sp)
-    d["align"] = asdict(sp.align)
-    return d
+    # Explicit literals: asdict() deep-copies every field through copy.deepcopy
+    al = sp.align
+    return {
+        "aid": sp.aid,
+        "page": sp.page,
+        "vi": sp.vi,
+        "en": sp.en,
+        "align": None if al is None else {"status": al.status, "method": al.method, "source": al.source},
+    }
 
 
 def _section_to_dict(sec: Section) -> Dict[str, Any]:
@@ -991,33 +1106,106 @@ def _section_to_dict(sec: Section) -> Dict[str, Any]:
     }
 
 
-def bundle_to_dict(bundle: Bundle) -> Dict[str, Any]:
-    sections: List[Dict[str, Any]] = [_section_to_dict(sec) for sec in bundle.sections]
+def _section_block_to_dict(sb: SectionBlock) -> Dict[str, Any]:
+    return {"aid": sb.aid, "en": sb.en, "vi": sb.vi, "pagination": sb.pagination}
+
+
+# Top-level lists that are converted (and, when writing, encoded) element by element
+_PER_ITEM_FIELDS = {"sections": _section_to_dict, "section_blocks": _section_block_to_dict}
 
-    section_blocks: Optional[List[Dict[str, Any]]] = [
-        {
-            "aid": sb.aid,
-            "en": sb.en,
-            "vi": sb.vi,
-            "pagination": sb.pagination,
-        }
-        for sb in (bundle.section_blocks or [])
-    ] or None
 
+def _bundle_fields(bundle: Bundle) -> Dict[str, Any]:
+    """Top-level bundle keys in output order; sections/section_blocks still hold dataclasses."""
     return {
         "doc_id": bundle.doc_id,
         "title": bundle.title,
         "pages": bundle.pages,
-        "sections": sections,
+        "sections": bundle.sections,
         "annotations": bundle.annotations,
         "aid_index": bundle.aid_index,
-        "section_blocks": section_blocks,
+        "section_blocks": bundle.section_blocks or None,
         "edits": bundle.edits or None,
     }
 
-def write_bundle_json(bundle: Bundle, out_path: Path) -> None:
+
+def bundle_to_dict(bundle: Bundle) -> Dict[str, Any]:
+    obj = _bundle_fields(bundle)
+    for key, to_dict in _PER_ITEM_FIELDS.items():
+        if obj[key] is not None:
+            obj[key] = [to_dict(x) for x in obj[key]]
+    return obj
+
+
+def _dumps(obj: Any, depth: int = 0, pretty: bool = False) -> bytes:
+    """JSON for obj as it appears `depth` levels into the document (compact unless pretty)."""
+    if orjson is not None:
+        opt = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        data = orjson.dumps(obj, option=opt)
+    elif pretty:
+        data = json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    else:
+        data = json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    # Newlines inside strings are escaped, so every raw newline is layout: shifting
+    # each line right gives exactly the nested rendering.
+    return data.replace(b"\n", b"\n" + b"  " * depth) if pretty and depth else data
+
+
+def _newline(depth: int, pretty: bool) -> bytes:
+    return b"\n" + b"  " * depth if pretty else b""
+
+
+def _iter_json_list(items: Iterable[Any], depth: int, pretty: bool = False) -> Iterator[bytes]:
+    """Yield a JSON array element by element (same bytes as _dumps(list(items), depth, pretty))."""
+    pad = _newline(depth + 1, pretty)
+    first = True
+    for it in items:
+        yield (b"[" if first else b",") + pad + _dumps(it, depth + 1, pretty)
+        first = False
+    yield b"[]" if first else _newline(depth, pretty) + b"]"
+
+
+def _iter_bundle_json(bundle: Bundle, pretty: bool = False) -> Iterator[bytes]:
+    """
+    Yield the JSON of bundle_to_dict(bundle) in pieces. Sections and section blocks
+    are converted and encoded one at a time, so neither the full dict tree nor the
+    whole output buffer is held in memory. Compact by default; pretty gives 2-space
+    indentation.
+    """
+    pad, colon = _newline(1, pretty), (b": " if pretty else b":")
+    sep = b"{"
+    for key, val in _bundle_fields(bundle).items():
+        yield sep + pad + _dumps(key) + colon
+        sep = b","
+        to_dict = _PER_ITEM_FIELDS.get(key)
+        if to_dict is not None and val is not None:
+            yield from _iter_json_list(map(to_dict, val), 1, pretty)
+        else:
+            yield _dumps(val, 1, pretty)
+    yield _newline(0, pretty) + b"}"
+
+def write_bundle_json(bundle: Bundle, out_path: Path, pretty: bool = False) -> None:
+    """
+    Stream bundle JSON and atomically replace out_path (readers never see a partial file).
+    Output is compact (the viewer parses it); pretty=True indents for humans.
+    """
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(bundle_to_dict(bundle), ensure_ascii=False, indent=2))
+    # Per-process temp name: parallel builds of journal dirs sharing a name
+    # (same doc_id) must not write through each other's temp file.
+    tmp = out_path.with_suffix(f".json.{os.getpid()}.tmp")
+    try:
+        # Raw fd writes of each encoded piece: no buffered/text file object on top
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            for chunk in _iter_bundle_json(bundle, pretty):
+                view = memoryview(chunk)
+                while view:
+                    view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp, out_path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 # ========== Discovery ==========
@@ -1035,23 +1223,37 @@ def find_journal_inputs(journal_dir: Path) -> Tuple[Path, Path, Path, Optional[P
     if not journal_dir.exists():
         raise FileNotFoundError(f"{journal_dir} not found")
 
-    vi_xml = next(iter(journal_dir.glob("full_cleaned_*.xml")), None)
-    en_xml = next(iter(journal_dir.glob("translation_*.xml")), None)
-    images_dir = journal_dir / "images"
-
-    # Optional sections JSON; accept common names
+    # One directory pass instead of a glob per input; the first match in directory
+    # order wins, as next(glob(...)) picked
+    vi_xml: Optional[Path] = None
+    en_xml: Optional[Path] = None
+    images_dir: Optional[Path] = None
+    json_names: set[str] = set()
+    with os.scandir(journal_dir) as it:
+        for e in it:
+            n = e.name
+            if n.endswith(".xml"):
+                if vi_xml is None and n.startswith("full_cleaned_"):
+                    vi_xml = journal_dir / n
+                elif en_xml is None and n.startswith("translation_"):
+                    en_xml = journal_dir / n
+            elif n == "images":
+                images_dir = journal_dir / n
+            elif n.endswith(".json"):
+                json_names.add(n)
+
+    # Optional sections JSON; accept common names (in order of preference)
     sections_json = None
     for candidate in ("sections.json", "section_metadata.json"):
-        p = journal_dir / candidate
-        if p.exists():
-            sections_json = p
+        if candidate in json_names:
+            sections_json = journal_dir / candidate
             break
 
     if not vi_xml:
         raise FileNotFoundError("Vietnamese OCR XML not found (expected full_cleaned_*.xml)")
     if not en_xml:
         raise FileNotFoundError("English translation XML not found (expected translation_*.xml)")
-    if not images_dir.exists():
+    if images_dir is None:
         raise FileNotFoundError("images/ directory not found")
 
     return vi_xml, en_xml, images_dir, sections_json
@@ -1059,7 +1261,9 @@ def find_journal_inputs(journal_dir: Path) -> Tuple[Path, Path, Path, Optional[P
 
 # ========== Orchestration ==========
 
-def build_from_journal_dir(journal_dir: Path, out_dir: Path) -> Tuple[Optional[Bundle], List[ValidationIssue]]:
+def build_from_journal_dir(
+    journal_dir: Path, out_dir: Path, pretty: bool = False
+) -> Tuple[Optional[Bundle], List[ValidationIssue]]:
     """
     Given a journal directory containing:
       - full_cleaned_<title>.xml   (Vietnamese OCR, pagebreak format)
@@ -1079,6 +1283,8 @@ def build_from_journal_dir(journal_dir: Path, out_dir: Path) -> Tuple[Optional[B
     en_res = parse_en_translation_xml(doc_id=doc_id, xml_path=en_xml)
 
     metas = _load_sections_json(doc_id, sections_json) if sections_json else None
+    # One images/ scan shared by page listing and validation
+    image_scan = _scan_images(images_dir)
 
     bundle = build_bundle(
         doc_id=doc_id,
@@ -1087,15 +1293,28 @@ def build_from_journal_dir(journal_dir: Path, out_dir: Path) -> Tuple[Optional[B
         parse_res=en_res,
         sections_meta=metas,
         fallback_title=en_res.doc_title or doc_id.replace("-", " ").title(),
+        image_scan=image_scan,
     )
 
-    issues = validate_bundle(bundle, images_dir=images_dir)
+    issues = validate_bundle(bundle, images_dir=images_dir, img_index=_image_page_index(image_scan))
 
     out_path = out_dir / f"{doc_id}.json"
-    write_bundle_json(bundle, out_path)
+    write_bundle_json(bundle, out_path, pretty=pretty)
     return bundle, issues
 
 
+def _build_one(journal_dir: Path, out_dir: Path, pretty: bool) -> Tuple[str, List[ValidationIssue]]:
+    """Worker entry point: build one journal dir, return only what main() reports (cheap to pickle)."""
+    try:
+        bundle, issues = build_from_journal_dir(journal_dir, out_dir, pretty)
+    except ET.ParseError as e:
+        # lxml's XMLSyntaxError carries its error log and can't be pickled back
+        # to the parent; hand main() a plain SyntaxError with the same message.
+        raise SyntaxError(str(e)) from None
+    assert bundle
+    return bundle.doc_id, issues
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     parser = argparse.ArgumentParser(description="Build JVB JSON bundles (two-AID, notes sidecars, section index)")
     parser.add_argument(
@@ -1104,23 +1323,37 @@ def main(argv: Optional[List[str]] = None) -> int:
     )
     parser.add_argument("--out", type=Path, default=Path("data"), help="Output directory for bundle JSON (default: ./data)")
     parser.add_argument("--report", action="store_true", help="Print validation issues report to stderr")
+    parser.add_argument("--pretty", action="store_true", help="Indent the bundle JSON (default: compact)")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes for multiple journal dirs (default: CPU count; 1 = build in-process)")
     args = parser.parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
-    exit_code = 0
-    for jd in args.journal_dirs:
-        try:
-            bundle, issues = build_from_journal_dir(jd, args.out)
-            assert bundle
-            print(f"[OK] {bundle.doc_id} → {args.out / f'{bundle.doc_id}.json'}")
-            if args.report and issues:
-                for it in issues:
-                    print(f" - {it.level}: {it.code}: {it.message}", file=sys.stderr)
-            if any(it.level == "ERROR" for it in issues):
-                exit_code = 2
-        except (FileNotFoundError, ET.ParseError, AssertionError) as e:
-            print(f"[FAIL] {jd}: {e}", file=sys.stderr)
-            exit_code = 1
+    # Journal dirs are independent (own inputs, own output file): fan out across
+    # processes. Results are still reported in argument order.
+    jobs: List[Path] = args.journal_dirs
+    workers = min(len(jobs), args.jobs or os.cpu_count() or 1)
+    ex = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    futs = [ex.submit(_build_one, jd, args.out, args.pretty) for jd in jobs] if ex else []
 
+    exit_code = 0
+    try:
+        for i, jd in enumerate(jobs):
+            try:
+                doc_id, issues = futs[i].result() if ex else _build_one(jd, args.out, args.pretty)
+                print(f"[OK] {doc_id} → {args.out / f'{doc_id}.json'}")
+                if args.report and issues:
+                    for it in issues:
+                        print(f" - {it.level}: {it.code}: {it.message}", file=sys.stderr)
+                if any(it.level == "ERROR" for it in issues):
+                    exit_code = 2
+            except (FileNotFoundError, SyntaxError, AssertionError) as e:  # SyntaxError covers ET.ParseError
+                print(f"[FAIL] {jd}: {e}", file=sys.stderr)
+                exit_code = 1
+    finally:
+        if ex:
+            # On Ctrl-C, don't leave queued journals running in the background
+            ex.shutdown(cancel_futures=True)
     return exit_code
 
 